@@ -1,18 +1,26 @@
 # 导入所需的Python库
 import mysql.connector                # MySQL数据库连接库
 from mysql.connector import pooling   # MySQL连接池管理
-import random                        # 随机数生成
+import numpy as np                   # 向量化批量生成随机数
 from datetime import datetime, timedelta  # 日期时间处理
-from snowflake import SnowflakeGenerator # 雪花ID生成器
 from config import DB_CONFIG         # 导入数据库配置
 import threading                     # 线程管理
 from queue import Queue, Empty       # 线程安全的队列和队列异常
 import time                         # 时间处理
 import signal                       # 信号处理
 import sys                          # 系统相关
+from itertools import chain, repeat # 展平批量插入的参数、按批次重复同一个值
+import os                           # 文件操作
+import tempfile                     # 临时文件
+import multiprocessing              # 进程间共享的停止信号
+from concurrent.futures import ProcessPoolExecutor  # 多进程并行，绕过GIL
 
-# 创建雪花ID生成器实例，用于生成全局唯一的ID
-gen = SnowflakeGenerator(42)        # 42是机器ID，范围是0-1023，确保在分布式系统中唯一
+# 雪花ID：高位为毫秒时间戳，中间10位为实例编号，低12位为毫秒内序列号；每个工作进程使用不同的实例编号，在run_worker中设置
+SNOWFLAKE_MACHINE_ID = 42           # 42是机器ID，范围是0-1023，工作进程i使用 42+i，确保各进程生成的ID不重复
+SNOWFLAKE_SEQ_PER_MS = 1 << 12      # 每毫秒可分配的序列号数量
+snowflake_instance = None           # 本进程的实例编号
+snowflake_last_ms = 0               # 本进程已分配ID的最大毫秒时间戳
+id_lock = threading.Lock()          # 雪花ID状态被进程内的生成线程和写入线程共享，批量申请ID时加锁
 
 # 定义各种空气质量参数的合理取值范围，包括最小值和最大值
 PARAMETER_RANGES = {
@@ -24,27 +32,53 @@ PARAMETER_RANGES = {
     'o3': (0, 300),         # 臭氧浓度范围：0-300 μg/m³
 }
 
+# 各参数保留的小数位数，CO精确到3位，其余为2位
+PARAMETER_DECIMALS = {name: (3 if name == 'co' else 2) for name in PARAMETER_RANGES}
+
+# 按PARAMETER_RANGES顺序预先计算各参数的下限和取值跨度（列向量，按参数逐行广播），供向量化生成使用
+PARAMETER_LOWS = np.array([low for low, _ in PARAMETER_RANGES.values()], dtype=np.float64).reshape(-1, 1)
+PARAMETER_SPANS = np.array([high - low for low, high in PARAMETER_RANGES.values()], dtype=np.float64).reshape(-1, 1)
+# 各参数的舍入比例（10的小数位数次方），下限和跨度预先乘上比例，缩放与舍入在同一遍计算中完成
+PARAMETER_SCALES = np.array([10.0 ** PARAMETER_DECIMALS[name] for name in PARAMETER_RANGES]).reshape(-1, 1)
+PARAMETER_SCALED_LOWS = PARAMETER_LOWS * PARAMETER_SCALES
+PARAMETER_SCALED_SPANS = PARAMETER_SPANS * PARAMETER_SCALES
+
 # 定义程序运行的关键参数
-BATCH_SIZE = 1000           # 每批次处理的数据量，用于批量插入数据库
-NUM_THREADS = 4             # 工作线程数量，用于并行处理数据
-QUEUE_MAX_SIZE = BATCH_SIZE * 10  # 队列大小
+BATCH_SIZE = 50000          # 每批次处理的数据量，超过max_allowed_packet时在插入时自动拆分为多条语句
+# 工作进程数量，默认与本进程可用的CPU核心数相同（受cpuset/容器限制时按实际可用核心计算），每个进程独立生成并写入数据，不受GIL限制
+NUM_WORKERS = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 4)
+QUEUE_MAX_SIZE = 2          # 每个工作进程内队列最多缓存的批次数，生成线程可在数据库等待期间提前准备下一批数据
 PROGRESS_INTERVAL = 1000    # 每处理多少条数据显示一次进度
+COMMIT_EVERY_N_BATCHES = 10 # 每写入多少批数据提交一次事务
+COMMIT_INTERVAL_SEC = 1     # 距上次提交超过多少秒时提交一次事务（与批次数条件先满足者为准）
+PIN_WORKERS = True          # 是否将每个工作进程（含其生成线程和写入线程）绑定到固定的CPU核心（仅Linux支持）
+FAST_INGEST_SESSION = True  # 是否在写入连接上关闭唯一性检查和外键检查（仅影响当前会话）
+DISABLE_BINLOG = False      # 是否同时关闭写入连接的binlog；开启后生成的数据不会同步到从库，也无法通过binlog做时间点恢复
+RANDOM_SEED = None          # 随机数种子，设置为整数时，相同的时间范围、间隔和设备数量生成相同的监测值（与工作进程数无关）；None表示每次运行随机
+DEBUG_CHECK_ORDER = False   # 是否检查每批数据的时间顺序（数据按时间顺序生成，仅调试时开启）
 
 # API配置
 TARGET_TABLE = "air_quality_monitoring_202503"  # 目标数据表名
 
-# 创建线程安全的队列
-data_queue = Queue(maxsize=QUEUE_MAX_SIZE)  # 创建更大的线程安全队列
+# 多行INSERT配置
+TABLE_COLUMNS = "(id, mn, monitor_time, pm25, pm10, co, no2, so2, o3, create_time, update_time)"  # 插入的字段列表
+INSERT_SQL_PREFIX = f"INSERT INTO {TARGET_TABLE} {TABLE_COLUMNS} VALUES "  # 多行INSERT语句的公共前缀
+ROW_PLACEHOLDER = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"  # 单行数据的占位符
+SINGLE_ROW_INSERT_SQL = INSERT_SQL_PREFIX + ROW_PLACEHOLDER  # 单条插入语句，用于逐条插入的降级路径和补充数据
+MN_INDEX = 1                # 数据行元组和按列数据均按TABLE_COLUMNS顺序排列，设备编号位于第2列
+MONITOR_TIME_INDEX = 2      # 监测时间位于第3列
+EST_ROW_BYTES = 256         # 单行数据在SQL文本中的估算字节数（含余量），用于按max_allowed_packet拆分语句
+PREPARED_PARAM_LIMIT = 65535  # 单条预处理语句最多允许的占位符数量（MySQL协议限制）
+rows_per_statement = BATCH_SIZE  # 单条INSERT语句的最大行数，启动时根据服务器max_allowed_packet计算
 
-# 创建线程安全的统计和检查机制
-insert_counts = {i: 0 for i in range(NUM_THREADS)}    # 记录每个线程插入的数据量
-thread_locks = {i: threading.Lock() for i in range(NUM_THREADS)}    # 为每个线程创建一个锁
-last_times = {i: None for i in range(NUM_THREADS)}    # 记录每个线程最后处理的时间
+# LOAD DATA配置
+USE_LOAD_DATA = False       # 是否使用LOAD DATA LOCAL INFILE批量导入（需要服务器开启local_infile）
+# LOAD DATA临时文件目录，优先使用内存文件系统/dev/shm，数据不落盘；不存在时使用系统默认临时目录
+LOAD_DATA_TMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
 
 # 添加程序状态控制
-running = True              # 控制程序运行状态的标志
-connection_pool = None      # 全局连接池对象
-active_threads = []         # 活动线程列表
+stop_event = None           # 进程间共享的停止信号，在main中创建并传给各工作进程
+connection_pool = None      # 工作进程内的连接池对象，由init_worker_process创建
 
 def signal_handler(signum, frame):
     """
@@ -52,300 +86,534 @@ def signal_handler(signum, frame):
     :param signum: 信号编号
     :param frame: 当前栈帧
     """
-    global running          # 声明全局变量
     print("\n收到终止信号，正在安全停止程序...")  # 提示用户程序正在停止
-    running = False         # 设置运行状态为False
     cleanup_resources()     # 清理资源
-    sys.exit(0)            # 退出程序
+    sys.exit(0)            # 退出程序，进程池退出时会等待各工作进程提交已写入的数据
 
 def cleanup_resources():
     """
-    清理程序资源，确保所有资源都被正确释放
+    清理程序资源，通知所有工作进程停止；各工作进程会提交已写入的数据并关闭自己的数据库连接
     """
-    global connection_pool, active_threads    # 声明全局变量
-    
     try:
-        # 向队列发送终止信号，通知所有工作线程停止
-        try:
-            # 清空队列中的剩余数据
-            while not data_queue.empty():
-                try:
-                    data_queue.get_nowait()
-                except:
-                    break
-            # 发送终止信号
-            data_queue.put(None)
-        except:
-            pass
-        
-        # 等待所有工作线程完成当前工作
-        if active_threads:
-            for t in active_threads:
-                if t and t.is_alive():
-                    try:
-                        t.join(timeout=5)  # 等待最多5秒
-                    except:
-                        pass
-                
-        # 关闭所有数据库连接
-        if connection_pool:
-            try:
-                # 获取连接池中的所有连接
-                if hasattr(connection_pool, '_cnx_queue'):
-                    while not connection_pool._cnx_queue.empty():
-                        try:
-                            conn = connection_pool._cnx_queue.get_nowait()
-                            if conn and conn.is_connected():
-                                conn.close()    # 关闭每个连接
-                        except:
-                            pass
-            except:
-                pass
-            
+        if stop_event is not None:
+            stop_event.set()    # 设置停止信号，工作进程检测到后停止生成并退出
         print("资源清理完成")       # 提示用户清理完成
         
     except Exception as e:
         print(f"清理资源时发生错误: {str(e)}")  # 输出清理过程中的错误，使用str(e)避免某些异常的格式化问题
 
-def generate_random_value(min_val, max_val, decimals=2):
-    """
-    生成指定范围内的随机数
-    :param min_val: 最小值
-    :param max_val: 最大值
-    :param decimals: 小数位数
-    :return: 随机数
-    """
-    # 在指定范围内生成随机浮点数
-    value = random.uniform(min_val, max_val)
-    # 四舍五入到指定小数位
-    return round(value, decimals)
-
-def generate_air_quality_data(mn, monitor_time):
-    """
-    生成一条空气质量数据记录
-    :param mn: 设备编号
-    :param monitor_time: 监测时间
-    :return: 包含所有监测数据的字典
-    """
-    # 创建一条完整的空气质量数据记录，包含所有必要字段
-    data = {
-        'id': str(next(gen)),  # 使用雪花算法生成唯一ID，确保全局唯一性
-        'mn': mn,              # 设备编号，用于标识不同的监测设备
-        'monitor_time': monitor_time,  # 监测时间，记录数据产生的时间点
-        # 生成各项空气质量指标的随机值，确保在合理范围内
-        'pm25': generate_random_value(*PARAMETER_RANGES['pm25']),    # PM2.5浓度，范围0-500
-        'pm10': generate_random_value(*PARAMETER_RANGES['pm10']),    # PM10浓度，范围0-600
-        'co': generate_random_value(*PARAMETER_RANGES['co'], 3),     # CO浓度，范围0-15，精确到3位小数
-        'no2': generate_random_value(*PARAMETER_RANGES['no2']),      # NO2浓度，范围0-200
-        'so2': generate_random_value(*PARAMETER_RANGES['so2']),      # SO2浓度，范围0-500
-        'o3': generate_random_value(*PARAMETER_RANGES['o3']),        # O3浓度，范围0-300
-        'create_time': datetime.now(),    # 记录创建时间，使用当前系统时间
-        'update_time': datetime.now()     # 记录更新时间，初始值与创建时间相同
-    }
-    return data
-
-def check_time_order(thread_id, batch_data):
+def allocate_ids(n):
+    """
+    一次性批量申请n个雪花ID
+    :param n: 需要的ID数量
+    :return: 整数ID列表（对应BIGINT UNSIGNED字段）
+    """
+    global snowflake_last_ms
+    with id_lock:
+        # 从当前毫秒（且晚于上次已分配的毫秒）开始，连续占用若干毫秒的全部序列号，向量化计算整批ID
+        start_ms = max(time.time_ns() // 1_000_000, snowflake_last_ms + 1)
+        offsets = np.arange(n, dtype=np.uint64)
+        ids = ((start_ms + offsets // SNOWFLAKE_SEQ_PER_MS) << 22) | (snowflake_instance << 12) | (offsets % SNOWFLAKE_SEQ_PER_MS)
+        snowflake_last_ms = start_ms + (n - 1) // SNOWFLAKE_SEQ_PER_MS
+    return ids.tolist()
+
+def pin_worker_process(thread_id):
+    """
+    将当前工作进程绑定到固定的CPU核心，进程内的生成线程和写入线程共享该核心的缓存，
+    队列数据不必在核心之间来回同步；平台不支持或可用核心不足时跳过
+    需在启动生成线程之前调用，之后创建的线程会继承该绑定
+    :param thread_id: 工作进程编号，第i个进程绑定到第i个可用核心
+    """
+    if not PIN_WORKERS or not hasattr(os, 'sched_setaffinity'):
+        return
+    try:
+        cores = sorted(os.sched_getaffinity(0))
+        # 可用核心少于工作进程数时不绑定，避免多个进程挤在同一个核心上
+        if len(cores) >= NUM_WORKERS:
+            os.sched_setaffinity(0, {cores[thread_id]})
+    except OSError as e:
+        print(f"绑定CPU核心失败: {e}")
+
+def generate_batch(mns, times, rng, out=None):
+    """
+    向量化生成一批空气质量监测值，所有时间点和设备一次性生成
+    :param mns: 设备编号列表
+    :param times: 监测时间列表
+    :param rng: numpy随机数生成器
+    :param out: 可选的预分配缓冲区（一维float64数组，长度不小于 6 * len(times) * len(mns)），
+                传入时直接在其中原地生成，批次之间复用，不再为每批分配临时数组
+    :return: 按PARAMETER_RANGES顺序排列的六个数组，每个数组长度为len(times) * len(mns)，
+             按时间优先顺序排列（同一时间点的所有设备相邻）；使用out时返回缓冲区的视图，下一次调用会覆盖
+    """
+    n = len(times) * len(mns)
+    size = len(PARAMETER_RANGES) * n
+    # 每个参数占一行连续内存（按列存储），取缓冲区前size个元素保证内存连续
+    values = (np.empty(size) if out is None else out[:size]).reshape(len(PARAMETER_RANGES), n)
+    # 原地生成均匀分布随机数，直接缩放到"取值范围×舍入比例"
+    rng.random(out=values)
+    values *= PARAMETER_SCALED_SPANS
+    values += PARAMETER_SCALED_LOWS
+    # 整个缓冲区一次取整再除回比例，即按各参数的小数位数四舍五入
+    np.rint(values, out=values)
+    values /= PARAMETER_SCALES
+    return tuple(values)
+
+def build_batch_columns(devices_arr, times, rng, out=None, keep=slice(None)):
+    """
+    按列生成一批空气质量数据，包含给定时间点的所有设备
+    :param devices_arr: 设备编号数组（object类型）
+    :param times: 监测时间数组（datetime64[s]）
+    :param rng: numpy随机数生成器
+    :param out: 可选的预分配缓冲区，传给generate_batch复用
+    :param keep: 只保留的时间点切片（步长为1）；监测值仍按全部时间点生成后再截取，保证随机数序列与完整批次一致
+    :return: (columns, now)，columns为按TABLE_COLUMNS字段顺序排列的各列数据（不含创建/更新时间），
+             每列按时间优先顺序排列；now为本批次的创建/更新时间
+    """
+    now = datetime.now()        # 本批次的创建时间，每批只读取一次系统时钟
+    # 一次性生成本批次所有时间点、所有设备的监测值，按时间优先顺序截取保留的时间点对应的行
+    start, stop, _ = keep.indices(len(times))
+    rows = slice(start * len(devices_arr), stop * len(devices_arr))
+    values = [column[rows].tolist() for column in generate_batch(devices_arr, times, rng, out)]
+    times = times[keep]
+    # 按时间优先顺序展开设备编号和监测时间，与监测值一一对应
+    mns = np.tile(devices_arr, len(times)).tolist()
+    monitor_times = np.repeat(times.astype(object), len(devices_arr)).tolist()   # 转换为datetime对象后展开
+    # 一次性申请本批次所需的全部ID
+    ids = allocate_ids(len(mns))
+    return (ids, mns, monitor_times, *values), now
+
+def columns_to_rows(columns, now):
+    """
+    将按列存储的批次数据组装为数据行，只在写入数据库前调用
+    :param columns: build_batch_columns返回的各列数据
+    :param now: 本批次的创建/更新时间
+    :return: 按TABLE_COLUMNS字段顺序排列的数据行元组列表，创建时间和更新时间共用同一个对象
+    """
+    return list(zip(*columns, repeat(now), repeat(now)))
+
+def check_time_order(thread_id, mns, monitor_times, current_last):
     """
     检查批次数据的时间顺序是否正确，确保数据时间的连续性
+    每批只包含一台设备的数据，同一设备内按时间顺序生成，仅在DEBUG_CHECK_ORDER开启时调用
     :param thread_id: 线程ID，用于标识不同的工作线程
-    :param batch_data: 待检查的批次数据列表
+    :param mns: 待检查批次的设备编号列
+    :param monitor_times: 待检查批次的监测时间列
+    :param current_last: 该线程上一批次最后一条记录的 (设备编号, 监测时间)，第一批为None
+    :return: 本批次最后一条记录的 (设备编号, 监测时间)，由调用方保存用于下一次检查
     """
-    # 使用线程锁确保线程安全，防止并发访问导致的问题
-    with thread_locks[thread_id]:
-        # 获取该线程上一次处理的最后时间点
-        current_last_time = last_times[thread_id]
-        
-        # 检查批次内部的时间顺序，确保时间递增
-        for i in range(1, len(batch_data)):
-            # 获取相邻两条记录的时间
-            prev_time = batch_data[i-1]['monitor_time']  # 前一条记录的时间
-            curr_time = batch_data[i]['monitor_time']    # 当前记录的时间
-            # 如果发现时间顺序错误，输出警告信息
-            if curr_time < prev_time:
-                print(f"警告：线程 {thread_id} 发现时间顺序异常！")
-                print(f"前一条记录时间: {prev_time}")
-                print(f"当前记录时间: {curr_time}")
-        
-        # 检查与上一批次的时间顺序，确保批次间的时间连续性
-        if current_last_time and batch_data[0]['monitor_time'] < current_last_time:
-            # 如果当前批次的开始时间早于上一批次的结束时间，输出警告
-            print(f"警告：线程 {thread_id} 批次间时间顺序异常！")
-            print(f"上一批次最后时间: {current_last_time}")
-            print(f"当前批次开始时间: {batch_data[0]['monitor_time']}")
-        
-        # 更新该线程的最后处理时间，用于下一次检查
-        last_times[thread_id] = batch_data[-1]['monitor_time']
+    # 将监测时间转换为datetime64数组，一次向量化比较检查批次内部的时间顺序
+    times = np.array(monitor_times, dtype='datetime64[ns]')
+    deltas = np.diff(times)
+    if not np.all(deltas >= np.timedelta64(0, 'ns')):
+        # 只输出第一处时间倒序的相邻记录
+        i = int(np.argmax(deltas < np.timedelta64(0, 'ns'))) + 1
+        print(f"警告：线程 {thread_id} 发现时间顺序异常！")
+        print(f"前一条记录时间: {monitor_times[i-1]}")
+        print(f"当前记录时间: {monitor_times[i]}")
+    
+    # 同一设备的相邻批次之间也要保持时间顺序；换到下一台设备时时间从头开始，不做比较
+    if current_last and mns[0] == current_last[0] and monitor_times[0] < current_last[1]:
+        # 如果当前批次的开始时间早于上一批次的结束时间，输出警告
+        print(f"警告：线程 {thread_id} 批次间时间顺序异常！")
+        print(f"上一批次最后时间: {current_last[1]}")
+        print(f"当前批次开始时间: {monitor_times[0]}")
+    
+    # 返回本批次的最后一条记录，用于下一次检查
+    return mns[-1], monitor_times[-1]
+
+def process_batch(conn, cursor, insert_statements, batch_columns):
+    """
+    将一批数据写入数据库（不提交事务，由调用方按提交间隔统一提交）
+    :param conn: 数据库连接
+    :param cursor: 普通数据库游标，用于LOAD DATA
+    :param insert_statements: 该连接上已预处理的INSERT语句缓存，见do_batch_insert
+    :param batch_columns: 按列存储的数据批次 (columns, now)，见build_batch_columns
+    """
+    if USE_LOAD_DATA:
+        # LOAD DATA直接按列序列化为文本，不组装数据行
+        do_bulk_load(cursor, *batch_columns)
+    else:
+        do_batch_insert(conn, insert_statements, columns_to_rows(*batch_columns))
 
-def process_batch(cursor, batch_data, thread_id, thread_name):
+def do_batch_insert(conn, insert_statements, batch_data):
     """
-    处理一批数据，包括检查时间顺序和插入数据库
+    执行批量插入操作，将数据写入数据库
+    使用多行INSERT预处理语句（VALUES (...),(...),...），按二进制协议传参；
+    每种行数的语句在连接上只预处理一次，之后每批只需发送参数，服务器不再重复解析SQL
+    :param conn: 数据库连接
+    :param insert_statements: 按行数缓存的 (预处理游标, SQL) 字典，由调用方持有，连接关闭前需关闭其中的游标
+    :param batch_data: 要插入的数据行列表，每行为按TABLE_COLUMNS顺序排列的元组
+    """
+    # 按单条语句最大行数拆分，确保SQL不超过服务器的max_allowed_packet和预处理语句的占位符上限
+    for start in range(0, len(batch_data), rows_per_statement):
+        chunk = batch_data[start:start + rows_per_statement]
+        statement = insert_statements.get(len(chunk))
+        if statement is None:
+            # 每个预处理游标只保留一条语句，不同行数各用一个游标；传入同一个SQL对象时游标直接复用已预处理的语句
+            sql = INSERT_SQL_PREFIX + ",".join([ROW_PLACEHOLDER] * len(chunk))
+            statement = insert_statements[len(chunk)] = (conn.cursor(prepared=True), sql)
+        prepared_cursor, sql = statement
+        # 将多行参数展平为一个元组，一次性执行
+        prepared_cursor.execute(sql, tuple(chain.from_iterable(chunk)))
+
+def do_bulk_load(cursor, columns, now):
+    """
+    使用LOAD DATA LOCAL INFILE批量导入数据，服务器按文本格式直接解析，跳过SQL解析
     :param cursor: 数据库游标
-    :param batch_data: 要处理的数据批次
-    :param thread_id: 线程ID
-    :param thread_name: 线程名称
+    :param columns: 按TABLE_COLUMNS字段顺序排列的各列数据（不含创建/更新时间），见build_batch_columns
+    :param now: 本批次的创建/更新时间
     """
+    # 逐列转换为文本，创建/更新时间整批只格式化一次
+    now_text = [str(now)] * len(columns[0])
+    text_columns = [list(map(str, column)) for column in columns]
+    # 各列按行拼接为制表符分隔、换行结尾的文本；设备编号和数值都不含分隔符，无需转义
+    text = "\n".join(map("\t".join, zip(*text_columns, now_text, now_text))) + "\n"
+    # mysql.connector只支持从文件读取LOAD DATA数据，先将批次写入临时文件
+    # 临时文件放在内存文件系统中，相当于从内存缓冲区导入
+    with tempfile.NamedTemporaryFile('w', suffix='.tsv', delete=False, dir=LOAD_DATA_TMP_DIR,
+                                     newline='', encoding='utf-8') as f:
+        f.write(text)
+        path = f.name
     try:
-        # 检查时间顺序
-        check_time_order(thread_id, batch_data)
-        # 执行批量插入
-        do_batch_insert(cursor, batch_data)
-        # 更新计数器
-        with thread_locks[thread_id]:
-            insert_counts[thread_id] += len(batch_data)
-            current_count = insert_counts[thread_id]
-        print(f"[{thread_name}] 已插入 {current_count} 条数据")
-    except Exception as e:
-        print(f"[{thread_name}] 处理批量插入时发生错误: {e}")
-        # 尝试逐条插入
-        for data in batch_data:
-            try:
-                cursor.execute(f"""
-                    INSERT INTO {TARGET_TABLE} 
-                    (id, mn, monitor_time, pm25, pm10, co, no2, so2, o3, create_time, update_time)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """, 
-                    (data['id'], data['mn'], data['monitor_time'], data['pm25'], 
-                     data['pm10'], data['co'], data['no2'], data['so2'], data['o3'], 
-                     data['create_time'], data['update_time']))
-                cursor.connection.commit()
-                with thread_locks[thread_id]:
-                    insert_counts[thread_id] += 1
-            except Exception as inner_e:
-                print(f"[{thread_name}] 单条数据插入失败: {inner_e}")
-
-def do_batch_insert(cursor, batch_data):
+        # 路径统一使用正斜杠，避免Windows路径中的反斜杠被当作转义符
+        cursor.execute(f"""
+            LOAD DATA LOCAL INFILE '{path.replace(os.sep, '/')}' INTO TABLE {TARGET_TABLE}
+            FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n'
+            {TABLE_COLUMNS}
+            """)
+    finally:
+        os.remove(path)     # 导入完成后删除临时文件
+
+def set_fast_ingest_session(cursor, thread_name, enabled):
     """
-    执行批量插入操作，将数据写入数据库
+    开启或恢复写入连接的批量导入会话设置，跳过逐行的唯一性检查和外键检查；DISABLE_BINLOG开启时同时跳过binlog写入
     :param cursor: 数据库游标
-    :param batch_data: 要插入的数据列表
+    :param thread_name: 线程名称
+    :param enabled: True为开启批量导入设置，False为恢复默认设置
+    """
+    value = 0 if enabled else 1
+    cursor.execute(f"SET SESSION unique_checks={value}, foreign_key_checks={value}")
+    if not DISABLE_BINLOG:
+        return
+    try:
+        # 修改sql_log_bin需要SUPER或SYSTEM_VARIABLES_ADMIN权限，没有权限时保持binlog开启
+        cursor.execute(f"SET SESSION sql_log_bin={value}")
+    except mysql.connector.Error as e:
+        if enabled:
+            print(f"[{thread_name}] 无法关闭binlog，将保持开启: {e}")
+
+def get_rows_per_statement(conn):
+    """
+    根据服务器的max_allowed_packet计算单条INSERT语句可容纳的最大行数
+    :param conn: 数据库连接
+    :return: 单条语句的最大行数，不超过BATCH_SIZE，且占位符数量不超过PREPARED_PARAM_LIMIT
+    """
+    cursor = conn.cursor()
+    cursor.execute("SHOW VARIABLES LIKE 'max_allowed_packet'")
+    row = cursor.fetchone()
+    cursor.close()
+    packet_bytes = int(row[1])
+    # 预留一行的余量给语句前缀，至少保证每条语句插入一行
+    return max(1, min(BATCH_SIZE, packet_bytes // EST_ROW_BYTES - 1,
+                      PREPARED_PARAM_LIMIT // ROW_PLACEHOLDER.count('%s')))
+
+def split_work_ranges(total, parts):
+    """
+    将 total 条记录平均切分为 parts 段连续的序号范围，切分方式与np.array_split相同（前 total%parts 段各多一条）
+    :param total: 记录总数
+    :param parts: 段数
+    :return: [(lo, hi), ...]，每段为左闭右开的序号范围
+    """
+    size, extra = divmod(total, parts)
+    ranges = []
+    lo = 0
+    for i in range(parts):
+        hi = lo + size + (1 if i < extra else 0)
+        ranges.append((lo, hi))
+        lo = hi
+    return ranges
+
+def iter_work_batches(work_range, total_points):
     """
-    # SQL插入语句，包含所有字段
-    sql = f"""
-    INSERT INTO {TARGET_TABLE} 
-    (id, mn, monitor_time, pm25, pm10, co, no2, so2, o3, create_time, update_time)
-    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    将按(设备, 时间)顺序展开的序号范围拆分为逐台设备、按时间块对齐的批次
+    展开序号 i 对应第 i // total_points 台设备的第 i % total_points 个时间点；
+    每台设备的时间点按BATCH_SIZE固定分块，批次不跨块，范围两端的批次可能只占块的一部分
+    :param work_range: 左闭右开的序号范围 (lo, hi)
+    :param total_points: 每台设备的时间点数
+    :return: 依次生成 (设备序号, 起始时间点序号, 结束时间点序号)，时间点为左闭右开
     """
-    # 准备批量插入的数据，将字典转换为元组列表
-    values = [(d['id'], d['mn'], d['monitor_time'], d['pm25'], d['pm10'], 
-              d['co'], d['no2'], d['so2'], d['o3'], d['create_time'], 
-              d['update_time']) for d in batch_data]
-    # 执行批量插入操作
-    cursor.executemany(sql, values)
+    lo, hi = work_range
+    for device_index in range(lo // total_points, (hi - 1) // total_points + 1):
+        offset = device_index * total_points
+        start, end = max(lo - offset, 0), min(hi - offset, total_points)
+        while start < end:
+            stop = min(start - start % BATCH_SIZE + BATCH_SIZE, end)
+            yield device_index, start, stop
+            start = stop
 
-def batch_insert_data(connection_pool, thread_id, start_time, end_time, devices, interval):
+def build_work_batch(devices, time_axis, entropy, device_index, start, end, out=None):
     """
-    批量插入数据的工作线程函数
+    按列生成一台设备在[start, end)时间点的数据
+    随机数生成器由 (种子, 设备序号, 时间块序号) 派生，同一条记录的监测值与工作进程数和切分方式无关
+    :param devices: 设备编号列表（全部设备）
+    :param time_axis: 时间轴，见axis_times
+    :param entropy: 随机数种子（SeedSequence的entropy）
+    :param device_index: 设备序号
+    :param start: 起始时间点序号
+    :param end: 结束时间点序号（不包含），与start位于同一时间块内，见iter_work_batches
+    :param out: 可选的预分配缓冲区，传给generate_batch复用
+    :return: (columns, now)，见build_batch_columns
+    """
+    chunk = start // BATCH_SIZE
+    chunk_start = chunk * BATCH_SIZE
+    rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(device_index, chunk)))
+    # 按整块时间点生成监测值，只保留本批次的部分，范围两端不完整的块也与整块生成时一致
+    times = axis_times(time_axis, chunk_start, min(chunk_start + BATCH_SIZE, time_axis[2]))
+    devices_arr = np.array([devices[device_index]], dtype=object)   # 单台设备，所有行复用同一个字符串对象
+    return build_batch_columns(devices_arr, times, rng, out, slice(start - chunk_start, end - chunk_start))
+
+def axis_times(time_axis, t0, t1):
+    """
+    按时间轴生成一段监测时间数组，工作进程按批次现算，无需传递完整的时间数组
+    :param time_axis: (开始时间, 时间间隔, 时间点数)，开始时间和间隔为datetime64[s]/timedelta64[s]
+    :param t0: 起始时间点序号
+    :param t1: 结束时间点序号（不包含）
+    :return: 监测时间数组（datetime64[s]）
+    """
+    start, step, _ = time_axis
+    return start + step * np.arange(t0, t1)
+
+def describe_work_range(devices, time_axis, work_range):
+    """
+    生成工作范围的描述文字，用于输出日志
+    :param devices: 设备编号列表
+    :param time_axis: 时间轴，见axis_times
+    :param work_range: 按(设备, 时间)顺序展开的序号范围 (lo, hi)
+    :return: "起始设备 起始时间 -> 结束设备 结束时间"
+    """
+    total_points = time_axis[2]
+    lo, hi = work_range
+    first_time = axis_times(time_axis, lo % total_points, lo % total_points + 1)[0].item()
+    last_time = axis_times(time_axis, (hi - 1) % total_points, (hi - 1) % total_points + 1)[0].item()
+    return f"{devices[lo // total_points]} {first_time} -> {devices[(hi - 1) // total_points]} {last_time}"
+
+def generate_worker_data(thread_id, devices, time_axis, work_range, entropy, data_queue, writer_done):
+    """
+    数据生成线程函数，逐台设备按时间顺序生成数据并放入对应工作线程专属的队列
+    :param thread_id: 线程ID
+    :param devices: 设备编号列表（全部设备）
+    :param time_axis: 时间轴，见axis_times
+    :param work_range: 本进程负责的按(设备, 时间)顺序展开的序号范围 (lo, hi)
+    :param entropy: 随机数种子，各批次的随机数生成器由其派生，见build_work_batch
+    :param data_queue: 对应工作线程专属的数据队列
+    :param writer_done: 写入线程已结束的标志，写入提前结束时生成线程随之停止
+    """
+    thread_name = f"Producer-{thread_id+1}"
+    # 监测值缓冲区，按最大批次预分配一次，之后每批复用
+    values_buffer = np.empty(len(PARAMETER_RANGES) * BATCH_SIZE)
+    # 停止信号只在批次之间检查，预先绑定为局部变量，避免每批查找全局变量
+    stop_requested = stop_event.is_set
+    writer_finished = writer_done.is_set
+    
+    try:
+        # 逐台设备处理，每批为同一台设备连续的若干个时间点，写入顺序即(mn, monitor_time)顺序
+        for device_index, start, end in iter_work_batches(work_range, time_axis[2]):
+            if stop_requested() or writer_finished():
+                break
+            batch_columns = build_work_batch(devices, time_axis, entropy, device_index, start, end, values_buffer)
+            # 整批按列放入队列，每批只需一次队列加锁，数据行在写入前才组装
+            data_queue.put(batch_columns)
+    except Exception as e:
+        print(f"[{thread_name}] 生成数据时发生错误: {e}")
+    finally:
+        # 发送终止信号，通知对应的工作线程数据已全部生成
+        data_queue.put(None)
+
+def batch_insert_data(connection_pool, thread_id, devices, time_axis, work_range, entropy, data_queue):
+    """
+    批量插入数据的写入函数，在工作进程的主线程中运行，从队列中取出数据并写入数据库
+    :return: 本进程成功插入的数据量
     """
     thread_name = f"Worker-{thread_id+1}"
     conn = None
-    cursor = None
-    batch_data = []
-    current_time = start_time
+    cursor = None                   # 普通游标，用于会话设置、LOAD DATA、逐条插入和补充数据
+    insert_statements = {}          # 按行数缓存的多行INSERT预处理语句
     expected_count = 0
+    local_count = 0                 # 本进程已提交的数据量
     retry_count = 0
     MAX_RETRIES = 3
     
     try:
         conn = connection_pool.get_connection()
         cursor = conn.cursor()
+        if FAST_INGEST_SESSION:
+            set_fast_ingest_session(cursor, thread_name, True)
         
-        print(f"[{thread_name}] 开始处理时间段: {start_time} 到 {end_time}")
+        work_description = describe_work_range(devices, time_axis, work_range)
+        print(f"[{thread_name}] 开始处理: {work_description}")
         
-        # 计算预期数据量（包含起始点和结束点）
-        time_points = int((end_time - start_time).total_seconds() / interval.total_seconds()) + 1
-        expected_count = time_points * len(devices)
+        # 计算预期数据量
+        expected_count = work_range[1] - work_range[0]
         print(f"[{thread_name}] 预期生成数据量: {expected_count} 条")
         
-        # 使用 <= 确保包含结束时间点
-        while running and current_time <= end_time:
-            for mn in devices:
-                if not running:
+        pending_batches = []            # 已写入但尚未提交的批次，回滚后需要重新写入
+        last_record = None              # 上一批次最后一条记录的(设备编号, 监测时间)，用于检查时间顺序
+        last_commit_time = time.monotonic()
+        
+        while True:
+            # 每次从队列中取出一整批按列存储的数据，None为终止信号，表示数据已全部生成
+            # 生成线程结束（包括收到停止信号）时总会放入且只放入一个终止信号，因此直接阻塞等待即可
+            batch_columns = data_queue.get()
+            batches_to_write = []
+            if batch_columns is not None:
+                if DEBUG_CHECK_ORDER:
+                    columns = batch_columns[0]
+                    last_record = check_time_order(thread_id, columns[MN_INDEX], columns[MONITOR_TIME_INDEX], last_record)
+                pending_batches.append(batch_columns)
+                batches_to_write.append(batch_columns)
+            # 每COMMIT_EVERY_N_BATCHES批或每COMMIT_INTERVAL_SEC秒提交一次，数据生成完毕时提交剩余批次
+            need_commit = (batch_columns is None
+                           or len(pending_batches) >= COMMIT_EVERY_N_BATCHES
+                           or time.monotonic() - last_commit_time >= COMMIT_INTERVAL_SEC)
+            
+            while retry_count < MAX_RETRIES:
+                try:
+                    for pending in batches_to_write:
+                        process_batch(conn, cursor, insert_statements, pending)
+                    if need_commit and pending_batches:
+                        conn.commit()
+                        # 提交成功后再更新计数器
+                        committed_count = sum(len(columns[0]) for columns, _ in pending_batches)
+                        local_count += committed_count
+                        print(f"[{thread_name}] 已插入 {local_count} 条数据")
+                        pending_batches = []
+                        last_commit_time = time.monotonic()
+                    retry_count = 0
                     break
-                    
-                data = generate_air_quality_data(mn, current_time)
-                batch_data.append(data)
-                
-                if len(batch_data) >= BATCH_SIZE:
-                    while retry_count < MAX_RETRIES:
-                        try:
-                            process_batch(cursor, batch_data, thread_id, thread_name)
-                            conn.commit()
-                            batch_data = []
-                            retry_count = 0
-                            break
-                        except Exception as e:
-                            retry_count += 1
-                            print(f"[{thread_name}] 批量插入重试 ({retry_count}/{MAX_RETRIES}): {e}")
-                            if retry_count >= MAX_RETRIES:
-                                # 如果重试失败，尝试逐条插入
-                                for single_data in batch_data:
-                                    try:
-                                        cursor.execute(f"""
-                                            INSERT INTO {TARGET_TABLE} 
-                                            (id, mn, monitor_time, pm25, pm10, co, no2, so2, o3, create_time, update_time)
-                                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                                            """, 
-                                            (single_data['id'], single_data['mn'], single_data['monitor_time'], 
-                                             single_data['pm25'], single_data['pm10'], single_data['co'], 
-                                             single_data['no2'], single_data['so2'], single_data['o3'], 
-                                             single_data['create_time'], single_data['update_time']))
-                                        conn.commit()
-                                        with thread_locks[thread_id]:
-                                            insert_counts[thread_id] += 1
-                                    except Exception as inner_e:
-                                        print(f"[{thread_name}] 单条数据插入失败: {inner_e}")
-                                batch_data = []
-                                retry_count = 0
+                except Exception as e:
+                    retry_count += 1
+                    print(f"[{thread_name}] 批量插入重试 ({retry_count}/{MAX_RETRIES}): {e}")
+                    # 回滚未提交的事务，重试时重新写入所有未提交的批次并立即提交
+                    conn.rollback()
+                    batches_to_write = pending_batches
+                    need_commit = True
+                    if retry_count >= MAX_RETRIES:
+                        # 如果重试失败，尝试逐条插入
+                        for single_data in chain.from_iterable(columns_to_rows(*pending) for pending in pending_batches):
+                            try:
+                                cursor.execute(SINGLE_ROW_INSERT_SQL, single_data)
+                                conn.commit()
+                                local_count += 1
+                            except Exception as inner_e:
+                                print(f"[{thread_name}] 单条数据插入失败: {inner_e}")
+                        pending_batches = []
+                        last_commit_time = time.monotonic()
+                        retry_count = 0
+                        break
             
-            current_time += interval
-        
-        # 处理剩余的数据
-        if batch_data:
-            process_batch(cursor, batch_data, thread_id, thread_name)
-            conn.commit()
+            if batch_columns is None:
+                break
         
         # 检查数据完整性
-        actual_count = insert_counts[thread_id]
+        actual_count = local_count
         if actual_count != expected_count:
             print(f"[{thread_name}] 警告：数据不完整！")
             print(f"[{thread_name}] 预期数据量: {expected_count}")
             print(f"[{thread_name}] 实际插入量: {actual_count}")
             print(f"[{thread_name}] 缺失数据量: {expected_count - actual_count}")
-            print(f"[{thread_name}] 时间范围: {start_time} -> {end_time}")
-            print(f"[{thread_name}] 时间点数: {time_points}")
+            print(f"[{thread_name}] 处理范围: {work_description}")
             
             # 尝试补充缺失的数据
-            if actual_count < expected_count:
+            if actual_count < expected_count and not stop_event.is_set():
                 print(f"[{thread_name}] 尝试补充缺失数据...")
-                current_time = start_time
-                while current_time <= end_time:
-                    for mn in devices:
-                        data = generate_air_quality_data(mn, current_time)
+                # 补充数据按相同的种子派生随机数，与正常写入时生成的监测值一致
+                for device_index, start, end in iter_work_batches(work_range, time_axis[2]):
+                    # 每批向量化生成同一台设备的数据，再逐条插入
+                    batch_columns = build_work_batch(devices, time_axis, entropy, device_index, start, end)
+                    for data in columns_to_rows(*batch_columns):
                         try:
-                            cursor.execute(f"""
-                                INSERT INTO {TARGET_TABLE} 
-                                (id, mn, monitor_time, pm25, pm10, co, no2, so2, o3, create_time, update_time)
-                                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                                """, 
-                                (data['id'], data['mn'], data['monitor_time'], data['pm25'], 
-                                 data['pm10'], data['co'], data['no2'], data['so2'], data['o3'], 
-                                 data['create_time'], data['update_time']))
+                            cursor.execute(SINGLE_ROW_INSERT_SQL, data)
                             conn.commit()
-                            with thread_locks[thread_id]:
-                                insert_counts[thread_id] += 1
+                            local_count += 1
                         except Exception as e:
                             if "Duplicate entry" not in str(e):
                                 print(f"[{thread_name}] 补充数据失败: {e}")
-                    current_time += interval
             
     except Exception as e:
         print(f"[{thread_name}] 发生错误: {e}")
     finally:
+        # 关闭游标时释放服务器端的预处理语句；连接已断开时服务器端的语句已随会话释放，无需关闭
+        if insert_statements and conn.is_connected():
+            for prepared_cursor, _ in insert_statements.values():
+                try:
+                    prepared_cursor.close()
+                except Exception as e:
+                    print(f"[{thread_name}] 关闭预处理语句失败: {e}")
         if cursor:
+            if FAST_INGEST_SESSION and conn.is_connected():
+                try:
+                    set_fast_ingest_session(cursor, thread_name, False)   # 归还连接前恢复会话设置
+                except Exception as e:
+                    print(f"[{thread_name}] 恢复会话设置失败: {e}")
             cursor.close()
         if conn and conn.is_connected():
             conn.close()
         print(f"[{thread_name}] 工作线程结束，资源已清理")
+    return local_count
+
+def init_worker_process(pool_config, shared_stop_event, statement_rows):
+    """
+    工作进程初始化函数，在每个工作进程启动时执行一次
+    :param pool_config: 连接池配置
+    :param shared_stop_event: 主进程创建的停止信号
+    :param statement_rows: 单条INSERT语句的最大行数
+    """
+    global connection_pool, stop_event, rows_per_statement
+    # 终止信号由主进程统一处理，工作进程通过stop_event感知停止
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    stop_event = shared_stop_event
+    rows_per_statement = statement_rows
+    try:
+        # 每个进程使用自己的连接池，连接不能跨进程共享
+        connection_pool = mysql.connector.pooling.MySQLConnectionPool(**pool_config)
+    except Exception as e:
+        print(f"工作进程 {os.getpid()} 创建数据库连接池失败: {e}")
+
+def run_worker(thread_id, devices, time_axis, work_range, entropy):
+    """
+    工作进程函数，负责一段连续的(设备, 时间)数据：生成线程生成数据放入队列，主线程从队列取出并写入数据库
+    :param thread_id: 工作进程编号
+    :param devices: 设备编号列表（全部设备）
+    :param time_axis: 时间轴，见axis_times
+    :param work_range: 本进程负责的按(设备, 时间)顺序展开的序号范围 (lo, hi)
+    :param entropy: 随机数种子，见build_work_batch
+    :return: 本进程成功插入的数据量
+    """
+    global snowflake_instance
+    # 每个进程使用不同的实例编号，保证跨进程生成的雪花ID不重复
+    snowflake_instance = (SNOWFLAKE_MACHINE_ID + thread_id) % 1024
+    pin_worker_process(thread_id)
+    
+    # 进程内的数据队列，生成与写入并行进行
+    data_queue = Queue(maxsize=QUEUE_MAX_SIZE)
+    writer_done = threading.Event()
+    producer = threading.Thread(
+        target=generate_worker_data,
+        args=(thread_id, devices, time_axis, work_range, entropy, data_queue, writer_done),
+        name=f"Producer-{thread_id+1}"
+    )
+    producer.start()
+    try:
+        return batch_insert_data(connection_pool, thread_id, devices, time_axis, work_range, entropy, data_queue)
+    finally:
+        # 写入提前结束（如数据库连接失败）时通知生成线程停止，并取走队列中的数据，避免其阻塞在put上
+        writer_done.set()
+        while producer.is_alive():
+            try:
+                data_queue.get(timeout=0.1)
+            except Empty:
+                pass
 
 def get_user_input():
     """
@@ -436,23 +704,50 @@ def get_user_input():
 
 def main():
     """主函数"""
-    global connection_pool, active_threads, running
+    global stop_event, rows_per_statement
     
     try:
-        # 注册信号处理器
+        # 创建进程间共享的停止信号，并注册信号处理器
+        stop_event = multiprocessing.Event()
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
         
         # 获取用户输入的参数
         start_time, end_time, interval, device_count, max_records = get_user_input()
         
-        # 创建数据库连接池
-        print("\n正在初始化数据库连接池...")
-        pool_config = DB_CONFIG.copy()
+        # 准备数据库连接配置
+        print("\n正在检查数据库连接...")
+        db_config = DB_CONFIG.copy()
+        # 使用C扩展实现的协议层，参数转换和结果解析在C中完成；未安装C扩展时退回纯Python实现
+        db_config['use_pure'] = not mysql.connector.HAVE_CEXT
+        if db_config['use_pure']:
+            print("警告：未检测到mysql-connector的C扩展，将使用纯Python实现，写入速度会明显下降")
+        if USE_LOAD_DATA:
+            db_config['allow_local_infile'] = True    # 允许客户端发送本地数据文件
+        db_config['autocommit'] = False                # 显式关闭自动提交，由写入函数按批次分组提交
+        # DB_CONFIG未配置字符集时使用utf8mb4及其二进制排序规则，字符串按字节比较，无需按语言规则处理；
+        # 已配置字符集时以DB_CONFIG为准，不再附加排序规则，避免与其字符集不匹配
+        if 'charset' not in db_config:
+            db_config['charset'] = 'utf8mb4'
+            db_config.setdefault('collation', 'utf8mb4_bin')
+        # 连接建立后将事务隔离级别设为READ COMMITTED，批量插入时不加间隙锁；
+        # init_command只能执行一条语句，DB_CONFIG中已指定时保留用户的设置
+        db_config.setdefault('init_command', "SET SESSION TRANSACTION ISOLATION LEVEL READ COMMITTED")
+        
+        # 根据服务器的max_allowed_packet确定单条INSERT语句的行数
+        # 主进程使用临时连接查询，在创建工作进程前关闭，避免连接被子进程继承
+        conn = mysql.connector.connect(**db_config)
+        try:
+            rows_per_statement = get_rows_per_statement(conn)
+        finally:
+            conn.close()
+        print("数据库连接成功！")
+        print(f"单条INSERT语句最大行数: {rows_per_statement}")
+        
+        # 每个工作进程只有一个写入线程，逐条插入和补充数据也复用同一个连接，连接池大小为1即可
+        pool_config = db_config.copy()
         pool_config['pool_name'] = 'mypool'
-        pool_config['pool_size'] = NUM_THREADS
-        connection_pool = mysql.connector.pooling.MySQLConnectionPool(**pool_config)
-        print("数据库连接池创建成功！")
+        pool_config['pool_size'] = 1
         
         # 根据用户选择设置时间间隔
         if interval == 'second':
@@ -465,53 +760,47 @@ def main():
         # 生成设备列表
         devices = [f'MN{str(i).zfill(5)}' for i in range(1, device_count + 1)]
         
-        # 计算总的时间点数和预期总数据量
-        total_seconds = (end_time - start_time).total_seconds()
-        total_points = int(total_seconds / delta.total_seconds()) + 1
+        # 时间轴：开始时间、时间间隔和时间点数（包含结束时间），工作进程按需生成各批次的时间，不传递完整的时间数组
+        time_start = np.datetime64(start_time, 's')
+        time_step = np.timedelta64(int(delta.total_seconds()), 's')
+        total_points = int((np.datetime64(end_time, 's') - time_start) // time_step) + 1
+        time_axis = (time_start, time_step, total_points)
+        
+        # 计算预期总数据量
         total_expected_records = total_points * device_count
-        points_per_thread = total_points // NUM_THREADS
-        remaining_points = total_points % NUM_THREADS
+        
+        # 将全部记录按(设备, 时间)顺序展开，平均切分为连续的序号范围，每个工作进程处理一段：
+        # 各进程数据量最多相差一条，进程内逐台设备按时间顺序写入
+        worker_count = min(NUM_WORKERS, total_expected_records)
+        work_ranges = split_work_ranges(total_expected_records, worker_count)
         
         print(f"\n数据生成预估:")
         print(f"总时间点数: {total_points}")
         print(f"设备数量: {device_count}")
         print(f"预计总数据量: {total_expected_records} 条")
-        print(f"每个线程基础时间点数: {points_per_thread}")
-        print(f"剩余时间点数: {remaining_points}")
+        print(f"工作进程数量: {worker_count}")
+        print(f"时间范围: {time_start.item()} -> {axis_times(time_axis, total_points - 1, total_points)[0].item()}")
         
-        # 创建并启动工作线程
-        threads = []
-        current_start = start_time
+        # 随机数种子只初始化一次，各批次再按(设备序号, 时间块序号)派生相互独立的随机数生成器
+        seed_entropy = np.random.SeedSequence(RANDOM_SEED).entropy
+        print(f"随机数种子: {seed_entropy}")
         
-        for i in range(NUM_THREADS):
-            # 计算当前线程的时间点数（考虑剩余点数的分配）
-            thread_points = points_per_thread + (1 if i < remaining_points else 0)
-            thread_end = current_start + delta * (thread_points - 1)  # 减1是因为包含起始点
-            
-            if i == NUM_THREADS - 1:
-                thread_end = end_time  # 确保最后一个线程处理到结束时间
-            
-            print(f"线程 {i+1}: {current_start} -> {thread_end} ({thread_points} 点)")
-            
-            thread = threading.Thread(
-                target=batch_insert_data,
-                args=(connection_pool, i, current_start, thread_end, devices, delta),
-                name=f"Worker-{i+1}"
-            )
-            thread.start()
-            threads.append(thread)
-            
-            current_start = thread_end + delta  # 下一个线程的开始时间
-        
-        # 保存活动线程列表
-        active_threads = threads
+        # 创建工作进程池，每个工作进程负责一段连续的(设备, 时间)数据
+        futures = []
         
-        # 等待所有线程完成
-        for t in threads:
-            t.join()
+        with ProcessPoolExecutor(max_workers=worker_count,
+                                 initializer=init_worker_process,
+                                 initargs=(pool_config, stop_event, rows_per_statement)) as executor:
+            for i, work_range in enumerate(work_ranges):
+                print(f"工作进程 {i+1}: {describe_work_range(devices, time_axis, work_range)} "
+                      f"({work_range[1] - work_range[0]} 条)")
+                futures.append(executor.submit(run_worker, i, devices, time_axis, work_range, seed_entropy))
+            
+            # 等待所有工作进程完成，按进程编号汇总各进程的插入数量
+            insert_counts = [future.result() for future in futures]
             
         # 显示最终统计信息
-        total_inserted = sum(insert_counts.values())
+        total_inserted = sum(insert_counts)
         print(f"\n数据生成完成！")
         print(f"预计总数据量: {total_expected_records} 条")
         print(f"实际插入总量: {total_inserted} 条")
@@ -521,9 +810,10 @@ def main():
         else:
             print("数据生成完整，无缺失")
             
-        print("\n各线程插入统计：")
-        for thread_id in range(NUM_THREADS):
-            thread_expected = (points_per_thread + (1 if thread_id < remaining_points else 0)) * device_count
+        print("\n各工作进程插入统计：")
+        for thread_id in range(worker_count):
+            lo, hi = work_ranges[thread_id]
+            thread_expected = hi - lo
             actual = insert_counts[thread_id]
             print(f"Worker-{thread_id+1}: 预期 {thread_expected} 条, 实际 {actual} 条, " + 
                   (f"完成率 {(actual/thread_expected)*100:.2f}%" if actual != thread_expected else "完整"))